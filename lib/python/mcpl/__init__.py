@@ -5,6 +5,13 @@ Python Client Library
 This package provides utilities for working with the MCP-L protocol.
 """
 
-from .client import MessageBuilder, validate_message
+from .client import (
+    MessageBuilder,
+    build_message,
+    get_schema,
+    get_validator,
+    validate_message,
+    validate_messages,
+)
 
 __version__ = '0.1.0'
@@ -3,11 +3,141 @@ MCP-L Client Implementation
 Following Semantic Seed Coding Standards with TDD approach
 """
 
+import functools
+import itertools
 import json
-import os
-import pkg_resources
-from typing import List, Dict, Union, Optional, Any
-import jsonschema
+import sys
+from importlib.resources import files
+from typing import Iterable, List, Dict, Tuple, Union, Optional, Any
+
+# Interned tag keys used by the MessageBuilder add_* methods. Interning
+# guarantees the pointer-equality fast path in dict key hashing on every
+# write, regardless of how the literals were compiled.
+_K_SENTIMENT = sys.intern("sentiment")
+_K_MIRROR_INTENT = sys.intern("mirror_intent")
+_K_CLARIFY_BEFORE_EXECUTE = sys.intern("clarify_before_execute")
+_K_FOLLOW_UP_REQUIRED = sys.intern("follow_up_required")
+_K_SUGGESTED_TONE = sys.intern("suggested_tone")
+_K_AGENT_FEEDBACK = sys.intern("agent_feedback")
+_K_SSCS_COMPLIANCE = sys.intern("sscs_compliance")
+
+# orjson parses JSON several times faster than the stdlib; fall back to
+# json.loads when it is not installed. Both return plain dicts, so the
+# rest of the module is agnostic to which one is in use.
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+
+@functools.lru_cache(maxsize=1)
+def _load_schema() -> Dict[str, Any]:
+    """
+    Load the MCP-L schema shipped with the package.
+
+    Returns:
+        The parsed schema as a dictionary
+
+    Raises:
+        ValueError: If the schema cannot be located
+    """
+    # importlib.resources resolves the packaged schema in wheels, zipapps,
+    # and source checkouts alike, so a single lookup replaces the previous
+    # stat-then-fallback dance.
+    try:
+        schema_data = files('mcpl').joinpath('schema/mcp-l-schema.json').read_bytes()
+    except FileNotFoundError:
+        raise ValueError("Could not find MCP-L schema. Please ensure the package is correctly installed.")
+    return _loads(schema_data)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_validator() -> Tuple[Any, Dict[str, Any]]:
+    """
+    Build the schema validator on first use and cache it.
+
+    Importing jsonschema and compiling the schema are deferred to the first
+    validation call, so 'import mcpl' stays cheap for callers that only
+    build messages. The lru_cache makes subsequent calls an O(1) lookup.
+
+    Returns:
+        Tuple of (validator, schema)
+
+    Raises:
+        ImportError: If the optional jsonschema dependency is not installed
+    """
+    try:
+        import jsonschema
+    except ImportError:
+        raise ImportError(
+            "jsonschema is required for detailed validation errors. "
+            "Install it with 'pip install mcpl[detailed-errors]'."
+        )
+
+    schema = _load_schema()
+    jsonschema.Draft7Validator.check_schema(schema)
+
+    # The MCP-L enums (sentiments, tones, story types, TDD phases) are all
+    # small string lists that jsonschema scans linearly on every check.
+    # Replace the enum keyword with a frozenset membership test, caching one
+    # frozenset per enum list in the schema; anything outside the plain
+    # string case is delegated to the stock implementation.
+    default_enum = jsonschema.Draft7Validator.VALIDATORS["enum"]
+    enum_sets: Dict[int, Optional[frozenset]] = {}
+
+    def fast_enum(validator, enums, instance, schema_part):
+        try:
+            members = enum_sets[id(enums)]
+        except KeyError:
+            try:
+                members = frozenset(enums)
+            except TypeError:
+                members = None
+            enum_sets[id(enums)] = members
+
+        if members is None or not isinstance(instance, str):
+            yield from default_enum(validator, enums, instance, schema_part)
+        elif instance not in members:
+            yield jsonschema.exceptions.ValidationError(
+                f"{instance!r} is not one of {enums!r}"
+            )
+
+    validator_class = jsonschema.validators.extend(
+        jsonschema.Draft7Validator, {"enum": fast_enum}
+    )
+
+    # A single FormatChecker is shared by the one cached validator, so any
+    # format/pattern state it builds up is reused across all validations
+    # instead of being rebuilt per validator construction.
+    format_checker = jsonschema.FormatChecker()
+    return validator_class(schema, format_checker=format_checker), schema
+
+
+@functools.lru_cache(maxsize=1)
+def _get_fast_validator() -> Any:
+    """
+    Compile the schema with fastjsonschema on first use and cache it.
+
+    fastjsonschema generates Python code specialized to the schema, making
+    repeated validations roughly two orders of magnitude faster than
+    interpreter-level schema walking in jsonschema.
+
+    Returns:
+        A callable that raises fastjsonschema.JsonSchemaException on
+        invalid input
+    """
+    # Prefer the validator module generated ahead of time by the build_py
+    # step in setup.py; it skips schema parsing and compilation entirely.
+    try:
+        from ._schema_validator import validate
+        return validate
+    except ImportError:
+        pass
+
+    import fastjsonschema
+
+    return fastjsonschema.compile(_load_schema())
 
 
 class MessageBuilder:
@@ -15,10 +145,14 @@ class MessageBuilder:
     Builder class for creating MCP-L protocol messages.
     Follows the fluent interface pattern for method chaining.
     """
-    
+
+    __slots__ = ("message", "_tags")
+
     def __init__(self):
         """Initialize a new MCP-L message builder."""
-        self.message = {"behavior_tags": {}}
+        tags: Dict[str, Any] = {}
+        self._tags = tags
+        self.message = {"behavior_tags": tags}
     
     def add_sentiment(self, sentiment: str, confidence: Optional[float] = None) -> 'MessageBuilder':
         """
@@ -35,7 +169,7 @@ class MessageBuilder:
         if confidence is not None:
             sentiment_data["confidence"] = confidence
             
-        self.message["behavior_tags"]["sentiment"] = sentiment_data
+        self._tags[_K_SENTIMENT] = sentiment_data
         return self
     
     def add_mirror_intent(self, mirrored_text: str, confidence: Optional[float] = None) -> 'MessageBuilder':
@@ -53,7 +187,7 @@ class MessageBuilder:
         if confidence is not None:
             mirror_data["confidence"] = confidence
             
-        self.message["behavior_tags"]["mirror_intent"] = mirror_data
+        self._tags[_K_MIRROR_INTENT] = mirror_data
         return self
     
     def add_clarify_before_execute(self, required: bool, 
@@ -76,7 +210,7 @@ class MessageBuilder:
         if options:
             clarify_data["options"] = options
             
-        self.message["behavior_tags"]["clarify_before_execute"] = clarify_data
+        self._tags[_K_CLARIFY_BEFORE_EXECUTE] = clarify_data
         return self
     
     def add_follow_up_required(self, required: bool, 
@@ -95,7 +229,7 @@ class MessageBuilder:
         if follow_up_items:
             follow_up_data["follow_up_items"] = follow_up_items
             
-        self.message["behavior_tags"]["follow_up_required"] = follow_up_data
+        self._tags[_K_FOLLOW_UP_REQUIRED] = follow_up_data
         return self
     
     def add_suggested_tone(self, tone: str, explanation: Optional[str] = None) -> 'MessageBuilder':
@@ -113,7 +247,7 @@ class MessageBuilder:
         if explanation:
             tone_data["explanation"] = explanation
             
-        self.message["behavior_tags"]["suggested_tone"] = tone_data
+        self._tags[_K_SUGGESTED_TONE] = tone_data
         return self
     
     def add_agent_feedback(self, context_update: Optional[str] = None,
@@ -135,7 +269,7 @@ class MessageBuilder:
             feedback_data["user_preferences"] = user_preferences
             
         if feedback_data:
-            self.message["behavior_tags"]["agent_feedback"] = feedback_data
+            self._tags[_K_AGENT_FEEDBACK] = feedback_data
         
         return self
     
@@ -162,7 +296,7 @@ class MessageBuilder:
             compliance_data["workflow_step"] = workflow_step
             
         if compliance_data:
-            self.message["sscs_compliance"] = compliance_data
+            self.message[_K_SSCS_COMPLIANCE] = compliance_data
         
         return self
     
@@ -176,6 +310,133 @@ class MessageBuilder:
         return self.message
 
 
+def get_schema() -> Dict[str, Any]:
+    """
+    Get the parsed MCP-L schema shipped with the package.
+
+    Returns:
+        The schema as a dictionary (cached; do not mutate)
+    """
+    return _load_schema()
+
+
+def get_validator() -> Any:
+    """
+    Get the cached jsonschema validator for the MCP-L schema.
+
+    Callers validating many messages in a loop should fetch the validator
+    once and reuse its iter_errors/is_valid methods per item instead of
+    rebuilding a validator each time. Requires the optional jsonschema
+    dependency ('pip install mcpl[detailed-errors]').
+
+    Returns:
+        The shared Draft 7 validator instance
+    """
+    return _get_validator()[0]
+
+
+def build_message(*,
+                  sentiment: Optional[str] = None,
+                  sentiment_confidence: Optional[float] = None,
+                  mirror_intent: Optional[str] = None,
+                  mirror_confidence: Optional[float] = None,
+                  clarify_required: Optional[bool] = None,
+                  clarification_prompt: Optional[str] = None,
+                  clarify_options: Optional[List[str]] = None,
+                  follow_up_required: Optional[bool] = None,
+                  follow_up_items: Optional[List[str]] = None,
+                  suggested_tone: Optional[str] = None,
+                  tone_explanation: Optional[str] = None,
+                  context_update: Optional[str] = None,
+                  user_preferences: Optional[Dict[str, Any]] = None,
+                  story_type: Optional[str] = None,
+                  tdd_phase: Optional[str] = None,
+                  workflow_step: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Build a complete MCP-L message in a single call.
+
+    Faster alternative to the fluent MessageBuilder chain when the tag set
+    is known up front: the whole message is assembled in one function frame
+    without intermediate builder state.
+
+    Args:
+        sentiment: Detected sentiment (e.g., 'frustrated', 'excited', 'neutral')
+        sentiment_confidence: Optional confidence score for the sentiment
+        mirror_intent: A rephrasing of the user's intent
+        mirror_confidence: Optional confidence score for the mirroring
+        clarify_required: Whether clarification is required before execution
+        clarification_prompt: Optional prompt to ask for clarification
+        clarify_options: Optional list of clarification options
+        follow_up_required: Whether follow-up is required after execution
+        follow_up_items: Optional list of follow-up items or questions
+        suggested_tone: Suggested tone (e.g., 'empathetic', 'technical')
+        tone_explanation: Optional explanation for the suggested tone
+        context_update: Optional context updates for future interactions
+        user_preferences: Optional learned user preferences
+        story_type: Optional story type ('feature', 'bug', 'chore')
+        tdd_phase: Optional TDD phase ('red', 'green', 'refactor')
+        workflow_step: Optional workflow step
+
+    Returns:
+        The constructed MCP-L message as a dictionary
+    """
+    tags: Dict[str, Any] = {}
+
+    if sentiment is not None:
+        data = {"detected": sentiment}
+        if sentiment_confidence is not None:
+            data["confidence"] = sentiment_confidence
+        tags["sentiment"] = data
+
+    if mirror_intent is not None:
+        data = {"mirrored_text": mirror_intent}
+        if mirror_confidence is not None:
+            data["confidence"] = mirror_confidence
+        tags["mirror_intent"] = data
+
+    if clarify_required is not None:
+        data = {"required": clarify_required}
+        if clarification_prompt:
+            data["clarification_prompt"] = clarification_prompt
+        if clarify_options:
+            data["options"] = clarify_options
+        tags["clarify_before_execute"] = data
+
+    if follow_up_required is not None:
+        data = {"required": follow_up_required}
+        if follow_up_items:
+            data["follow_up_items"] = follow_up_items
+        tags["follow_up_required"] = data
+
+    if suggested_tone is not None:
+        data = {"tone": suggested_tone}
+        if tone_explanation:
+            data["explanation"] = tone_explanation
+        tags["suggested_tone"] = data
+
+    if context_update or user_preferences:
+        data = {}
+        if context_update:
+            data["context_update"] = context_update
+        if user_preferences:
+            data["user_preferences"] = user_preferences
+        tags["agent_feedback"] = data
+
+    message = {"behavior_tags": tags}
+
+    if story_type or tdd_phase or workflow_step:
+        data = {}
+        if story_type:
+            data["story_type"] = story_type
+        if tdd_phase:
+            data["tdd_phase"] = tdd_phase
+        if workflow_step:
+            data["workflow_step"] = workflow_step
+        message["sscs_compliance"] = data
+
+    return message
+
+
 def validate_message(message: Dict[str, Any]) -> bool:
     """
     Validate an MCP-L message against the schema.
@@ -186,54 +447,85 @@ def validate_message(message: Dict[str, Any]) -> bool:
     Returns:
         True if the message is valid, False otherwise
     """
-    schema_path = os.path.join(os.path.dirname(__file__), 'schema', 'mcp-l-schema.json')
-    
-    # Try to find the schema in the package resources if not found locally
-    if not os.path.exists(schema_path):
-        try:
-            schema_data = pkg_resources.resource_string('mcpl', 'schema/mcp-l-schema.json')
-            schema = json.loads(schema_data)
-        except (pkg_resources.DistributionNotFound, FileNotFoundError):
-            raise ValueError("Could not find MCP-L schema. Please ensure the package is correctly installed.")
-    else:
-        with open(schema_path, 'r') as f:
-            schema = json.load(f)
-    
+    # Fast path: the schema requires an object with an object-valued
+    # 'behavior_tags', so the common rejection cases can be detected with
+    # two isinstance checks before paying for full schema validation.
+    if not isinstance(message, dict):
+        return False
+    if "behavior_tags" in message and not isinstance(message["behavior_tags"], dict):
+        return False
+
     try:
-        jsonschema.validate(instance=message, schema=schema)
+        import fastjsonschema
+    except ImportError:
+        # jsonschema fallback: iter_errors is a generator, so asking for the
+        # first error stops validation as soon as one is found instead of
+        # collecting the full error tree the way jsonschema.validate does.
+        validator, _ = _get_validator()
+        return next(validator.iter_errors(message), None) is None
+
+    try:
+        _get_fast_validator()(message)
         return True
-    except jsonschema.exceptions.ValidationError:
+    except fastjsonschema.JsonSchemaException:
         return False
 
 
+def validate_messages(messages: Iterable[Dict[str, Any]]) -> List[bool]:
+    """
+    Validate a batch of MCP-L messages against the schema.
+
+    Amortizes validator lookup and exception setup across the whole batch,
+    so validating N messages is cheaper than N validate_message calls.
+
+    Args:
+        messages: Iterable of messages to validate
+
+    Returns:
+        List of booleans, one per message, in input order
+    """
+    import fastjsonschema
+
+    validate = _get_fast_validator()
+    invalid = fastjsonschema.JsonSchemaException
+    results = []
+    append = results.append
+
+    for message in messages:
+        try:
+            validate(message)
+            append(True)
+        except invalid:
+            append(False)
+
+    return results
+
+
 def get_validation_errors(message: Dict[str, Any]) -> List[str]:
     """
     Get validation error messages for an MCP-L message.
-    
+
+    Requires the optional jsonschema dependency, installable via
+    'pip install mcpl[detailed-errors]'.
+
     Args:
         message: The message to validate
-        
+
     Returns:
         List of validation error messages
     """
-    schema_path = os.path.join(os.path.dirname(__file__), 'schema', 'mcp-l-schema.json')
-    
-    # Try to find the schema in the package resources if not found locally
-    if not os.path.exists(schema_path):
-        try:
-            schema_data = pkg_resources.resource_string('mcpl', 'schema/mcp-l-schema.json')
-            schema = json.loads(schema_data)
-        except (pkg_resources.DistributionNotFound, FileNotFoundError):
-            raise ValueError("Could not find MCP-L schema. Please ensure the package is correctly installed.")
-    else:
-        with open(schema_path, 'r') as f:
-            schema = json.load(f)
-    
-    validator = jsonschema.Draft7Validator(schema)
+    validator, _ = _get_validator()
+
+    # Valid messages are the common case; bail out before any list building
+    # or path formatting if the first error never materializes.
+    error_iter = validator.iter_errors(message)
+    first = next(error_iter, None)
+    if first is None:
+        return []
+
     errors = []
-    
-    for error in validator.iter_errors(message):
-        path = ".".join(str(p) for p in error.path) if error.path else "/"
+    for error in itertools.chain((first,), error_iter):
+        path = ".".join(map(str, error.path)) if error.path else "/"
         errors.append(f"{path}: {error.message}")
-    
+
     return errors
@@ -3,12 +3,53 @@ MCP-L Python Client Library Setup
 """
 
 from setuptools import setup, find_packages
+from setuptools.command.build_py import build_py
+import json
 import os
+import re
 
 # Read the contents of the README file
 with open('README.md', 'r', encoding='utf-8') as f:
     long_description = f.read()
 
+
+class BuildPyWithSchemaValidator(build_py):
+    """
+    Build step that compiles the MCP-L schema to a Python validator module.
+
+    The schema is fixed and ships with the package, so the fastjsonschema
+    compilation is done once here instead of at every interpreter start.
+    The generated mcpl/_schema_validator.py is written into the build tree
+    and imported by the client at runtime.
+    """
+
+    def run(self):
+        build_py.run(self)
+
+        try:
+            import fastjsonschema
+        except ImportError:
+            # The client falls back to compiling the schema at runtime.
+            return
+
+        schema_path = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)),
+            'mcpl', 'schema', 'mcp-l-schema.json'
+        )
+        with open(schema_path, 'r', encoding='utf-8') as f:
+            schema = json.load(f)
+
+        code = fastjsonschema.compile_to_code(schema)
+
+        # The generated entry point is named after the schema $id; alias it
+        # so the client can do 'from mcpl._schema_validator import validate'.
+        entry_point = re.search(r'^def (\w+)\(', code, re.MULTILINE).group(1)
+        code += '\n\nvalidate = {}\n'.format(entry_point)
+
+        target = os.path.join(self.build_lib, 'mcpl', '_schema_validator.py')
+        with open(target, 'w', encoding='utf-8') as f:
+            f.write(code)
+
 setup(
     name="mcpl",
     version="0.1.0",
@@ -19,6 +60,9 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/AINative-Studio/mcp-l-core",
     packages=find_packages(),
+    cmdclass={
+        'build_py': BuildPyWithSchemaValidator,
+    },
     package_data={
         'mcpl': ['schema/*.json', 'schema/*.yaml'],
     },
@@ -30,8 +74,12 @@ setup(
         "Intended Audience :: Developers",
         "Topic :: Software Development :: Libraries :: Python Modules"
     ],
-    python_requires=">=3.7",
+    python_requires=">=3.9",
     install_requires=[
-        "jsonschema>=4.0.0",
+        "fastjsonschema>=2.19",
     ],
+    extras_require={
+        "detailed-errors": ["jsonschema>=4.0.0"],
+        "orjson": ["orjson>=3.0"],
+    },
 )